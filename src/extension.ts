@@ -236,12 +236,12 @@ export function activate(context: vscode.ExtensionContext) {
 		}, async (progress) => {
 			progress.report({ message: 'Checking system dependencies...' });
 			try {
-				const pkgs = [];
-				if (!await isPackageInstalled('graphviz')) { pkgs.push('graphviz'); }
-				if (!isWindows && !await isPackageInstalled('libgraphviz-dev')) { pkgs.push('libgraphviz-dev'); }
-				if (!await isPackageInstalled(isWindows ? 'python' : 'python3')) { pkgs.push(isWindows ? 'python' : 'python3'); }
-				if (!isWindows && !await isPackageInstalled('python3-venv')) { pkgs.push('python3-venv'); }
-				if (!await isPackageInstalled(isWindows ? 'pip' : 'python3-pip')) { pkgs.push(isWindows ? 'pip' : 'python3-pip'); }
+				const required = isWindows
+					? ['graphviz', 'python', 'pip']
+					: ['graphviz', 'libgraphviz-dev', 'python3', 'python3-venv', 'python3-pip'];
+				// Run the checks concurrently, they are independent of each other
+				const installed = await Promise.all(required.map(isPackageInstalled));
+				const pkgs = required.filter((_, i) => !installed[i]);
 				if (pkgs.length > 0) {
 					const terminal = vscode.window.createTerminal({ name: 'Install System Dependencies' });
 					terminal.show();
@@ -390,17 +390,11 @@ export function activate(context: vscode.ExtensionContext) {
 					['-c', `. "${venvActivate}" && lean-blueprint-extract-local --project-dir "${folder}"`],
 					{ cwd: folder, env: process.env }
 				);
-				let stdout = '';
-				let stderr = '';
 				child.stdout.on('data', (data: Buffer) => {
-					const str = data.toString();
-					stdout += str;
-					outputChannel.append(str);
+					outputChannel.append(data.toString());
 				});
 				child.stderr.on('data', (data: Buffer) => {
-					const str = data.toString();
-					stderr += str;
-					outputChannel.append(str);
+					outputChannel.append(data.toString());
 				});
 				child.on('close', (code: number) => {
 					if (code !== 0) {